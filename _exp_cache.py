@@ -0,0 +1,113 @@
+import os
+import json
+import time
+import functools
+from collections import namedtuple
+from urllib.parse import urlparse
+import mlflow
+from mlflow.tracking import MlflowClient
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "mlflow_cli_tools")
+CACHE_PATH = os.path.join(CACHE_DIR, "experiments.json")
+CACHE_TTL_SECONDS = 60
+
+CachedExperiment = namedtuple("CachedExperiment", ["experiment_id", "name", "lifecycle_stage"])
+
+def _cache_key(tracking_uri, experiment_name):
+    return f"{tracking_uri}::{experiment_name}"
+
+def _is_disk_cacheable(tracking_uri):
+    # URIs without a host (sqlite:///mlflow.db, file paths) may be relative to the working
+    # directory, so the same string can point to different stores and is only cached in memory
+    return bool(urlparse(tracking_uri).netloc)
+
+def _is_valid_entry(entry):
+    return (
+        isinstance(entry, dict)
+        and isinstance(entry.get("cached_at"), (int, float))
+        and all(isinstance(entry.get(field), str) for field in CachedExperiment._fields)
+    )
+
+def _load_cache():
+    try:
+        with open(CACHE_PATH, 'r') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict):
+        return {}
+    # Malformed and expired entries are dropped so they are not written back
+    now = time.time()
+    return {
+        key: entry for key, entry in cache.items()
+        if _is_valid_entry(entry) and now - entry["cached_at"] < CACHE_TTL_SECONDS
+    }
+
+def _save_cache(cache):
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = f"{CACHE_PATH}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, CACHE_PATH)
+    except OSError:
+        # The cache is only an optimization, lookups still work without it
+        pass
+
+@functools.lru_cache(maxsize=None)
+def _lookup(tracking_uri, experiment_name):
+    if not _is_disk_cacheable(tracking_uri):
+        experiment = MlflowClient(tracking_uri).get_experiment_by_name(experiment_name)
+        if experiment is None:
+            return None
+        return CachedExperiment(experiment.experiment_id, experiment.name, experiment.lifecycle_stage)
+
+    key = _cache_key(tracking_uri, experiment_name)
+    cache = _load_cache()
+    entry = cache.get(key)
+    if entry:
+        return CachedExperiment(entry["experiment_id"], entry["name"], entry["lifecycle_stage"])
+
+    experiment = MlflowClient(tracking_uri).get_experiment_by_name(experiment_name)
+    if experiment is None:
+        return None
+
+    cache[key] = {
+        "experiment_id": experiment.experiment_id,
+        "name": experiment.name,
+        "lifecycle_stage": experiment.lifecycle_stage,
+        "cached_at": time.time(),
+    }
+    _save_cache(cache)
+    return CachedExperiment(experiment.experiment_id, experiment.name, experiment.lifecycle_stage)
+
+def get_experiment_by_name(experiment_name):
+    """
+    Looks up an experiment by name on the current tracking URI, reusing recent lookups.
+
+    Results are kept in memory and, for tracking URIs with a host, in a JSON file under
+    ~/.cache/mlflow_cli_tools for CACHE_TTL_SECONDS, so chained CLI calls skip the server
+    round-trip. Cached IDs may be stale, destructive commands should look experiments up directly.
+
+    Args:
+        experiment_name (str): The name of the MLflow experiment.
+
+    Returns:
+        CachedExperiment: Experiment ID, name and lifecycle stage, or None if not found.
+    """
+    return _lookup(mlflow.get_tracking_uri(), experiment_name)
+
+def invalidate(experiment_name):
+    """
+    Drops the cached lookup of an experiment on the current tracking URI.
+
+    Args:
+        experiment_name (str): The name of the MLflow experiment.
+    """
+    _lookup.cache_clear()
+    tracking_uri = mlflow.get_tracking_uri()
+    if not _is_disk_cacheable(tracking_uri):
+        return
+    cache = _load_cache()
+    if cache.pop(_cache_key(tracking_uri, experiment_name), None) is not None:
+        _save_cache(cache)
@@ -1,6 +1,32 @@
 import mlflow, click
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from mlflow.entities import ViewType
 from mlflow.tracking import MlflowClient
 
+MAX_WORKERS = 32
+MAX_RESULTS_PER_PAGE = 1000
+
+def _wait_for_deletions(futures):
+    """
+    Waits for submitted run deletions to finish.
+
+    Args:
+        futures (dict): Mapping of delete_run futures to their run IDs.
+
+    Returns:
+        tuple: Number of deleted runs and number of failed deletions.
+    """
+    deleted_count = 0
+    failed_count = 0
+    for future in as_completed(futures):
+        try:
+            future.result()
+            deleted_count += 1
+        except Exception as e:
+            failed_count += 1
+            print(f"Error deleting run {futures[future]}: {e}")
+    return deleted_count, failed_count
+
 def delete_all_runs_in_experiment(experiment_name, tracking_uri):
     """
     Deletes all runs within a given MLflow experiment.
@@ -24,14 +50,44 @@ def delete_all_runs_in_experiment(experiment_name, tracking_uri):
             print(f"Experiment '{experiment_name}' not found.")
             return
 
-        runs = client.search_runs(experiment_ids=[experiment.experiment_id], max_results=50000)
+        deleted_count = 0
+        failed_count = 0
+        page_token = None
+        pending = {}
+        # The client is shared across workers, each request mostly waits on the tracking server
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            while True:
+                # Deleted runs are kept in the view so page offsets stay valid while deletions land
+                runs_page = client.search_runs(
+                    experiment_ids=[experiment.experiment_id],
+                    run_view_type=ViewType.ALL,
+                    max_results=MAX_RESULTS_PER_PAGE,
+                    page_token=page_token
+                )
+                page_token = runs_page.token
+                # Only run IDs are needed, drop the page so its run data can be reclaimed
+                run_ids = [run.info.run_id for run in runs_page if run.info.lifecycle_stage != "deleted"]
+                del runs_page
+
+                # Drain the previous page only after the next one has been fetched
+                deleted, failed = _wait_for_deletions(pending)
+                deleted_count += deleted
+                failed_count += failed
+                if pending:
+                    print(f"Processed {deleted_count + failed_count} runs so far")
+
+                pending = {executor.submit(client.delete_run, run_id): run_id for run_id in run_ids}
+
+                if page_token is None:
+                    break
 
-        for run in runs:
-            run_id = run.info.run_id
-            client.delete_run(run_id)
-            print(f"Deleted run: {run_id}")
+            deleted, failed = _wait_for_deletions(pending)
+            deleted_count += deleted
+            failed_count += failed
 
-        print(f"Deleted {len(runs)} runs in experiment: {experiment_name}")
+        print(f"Deleted {deleted_count} runs in experiment: {experiment_name}")
+        if failed_count:
+            print(f"Failed to delete {failed_count} runs")
 
     except Exception as e:
         print(f"Error deleting runs: {e}")
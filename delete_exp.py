@@ -1,5 +1,6 @@
 import mlflow, click
 from mlflow.tracking import MlflowClient
+import _exp_cache
 
 def delete_mlflow_experiment(experiment_name, tracking_uri):
     """
@@ -24,6 +25,7 @@ def delete_mlflow_experiment(experiment_name, tracking_uri):
             return
 
         client.delete_experiment(experiment.experiment_id)
+        _exp_cache.invalidate(experiment_name)
         print(f"Experiment '{experiment_name}' deleted successfully.")
 
     except Exception as e:
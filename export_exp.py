@@ -1,15 +1,36 @@
 import os
 import click
-import pandas as pd
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
 import mlflow
 from mlflow.tracking import MlflowClient
+import _exp_cache
 import json
 
+MAX_DOWNLOAD_WORKERS = 32
+
+def _download_run_artifacts(client: MlflowClient, run_id: str, artifacts_dir: str):
+    """
+    Download the whole artifact tree of a run with a single recursive call
+    
+    Args:
+        client (MlflowClient): MLflow client to download with
+        run_id (str): ID of the run whose artifacts are downloaded
+        artifacts_dir (str): Directory where a folder per run is created
+    """
+    run_artifacts_dir = os.path.join(artifacts_dir, run_id)
+    os.makedirs(run_artifacts_dir, exist_ok=True)
+    client.download_artifacts(run_id, "", dst_path=run_artifacts_dir)
+
 def export_runs_detailed(
     experiment_name: str, 
     output_dir: str = None, 
     include_artifacts: bool = True,
-    tracking_uri: str = None
+    tracking_uri: str = None,
+    max_workers: int = MAX_DOWNLOAD_WORKERS,
+    output_format: str = "parquet"
 ):
     """
     Comprehensively export runs from an MLflow experiment with proper type preservation
@@ -19,6 +40,8 @@ def export_runs_detailed(
         output_dir (str, optional): Directory to export runs. Defaults to experiment name.
         include_artifacts (bool, optional): Whether to export run artifacts. Defaults to True.
         tracking_uri (str, optional): MLflow tracking URI. Defaults to current.
+        max_workers (int, optional): Number of concurrent artifact downloads. Defaults to 32.
+        output_format (str, optional): Format of the runs file, "parquet" or "csv". Defaults to "parquet".
     """
     if tracking_uri:
         mlflow.set_tracking_uri(tracking_uri)
@@ -32,7 +55,7 @@ def export_runs_detailed(
     os.makedirs(output_dir, exist_ok=True)
 
     try:
-        experiment = client.get_experiment_by_name(experiment_name)
+        experiment = _exp_cache.get_experiment_by_name(experiment_name)
         
         if not experiment:
             try:
@@ -50,11 +73,14 @@ def export_runs_detailed(
         
         print(f"Found experiment: {experiment.name} (ID: {experiment.experiment_id})")
         
-        detailed_runs_data = []
-        metadata = {"parameters": [], "metrics": [], "tags": []}
+        # Runs are accumulated column-wise, missing values are padded with None when a column is next
+        # written and at the end of every page
+        columns = {}
+        metric_set, param_set, tag_set = set(), set(), set()
         
         page_token = None
         total_runs = 0
+        row_count = 0
         max_results_per_page = 5000
 
         while True:
@@ -82,22 +108,29 @@ def export_runs_detailed(
                 for k, v in run.data.metrics.items():
                     column_name = f"metric:{k}"
                     run_data[column_name] = v
-                    if column_name not in metadata["metrics"]:
-                        metadata["metrics"].append(column_name)
+                    metric_set.add(column_name)
                 
                 for k, v in run.data.params.items():
                     column_name = f"param:{k}"
                     run_data[column_name] = v
-                    if column_name not in metadata["parameters"]:
-                        metadata["parameters"].append(column_name)
+                    param_set.add(column_name)
                 
                 for k, v in run.data.tags.items():
                     column_name = f"tag:{k}"
                     run_data[column_name] = v
-                    if column_name not in metadata["tags"]:
-                        metadata["tags"].append(column_name)
-                    
-                detailed_runs_data.append(run_data)
+                    tag_set.add(column_name)
+                
+                for column_name, value in run_data.items():
+                    values = columns.setdefault(column_name, [])
+                    if len(values) < row_count:
+                        values.extend([None] * (row_count - len(values)))
+                    values.append(value)
+                row_count += 1
+            
+            # Pad the columns the last runs of the page did not set, once per page instead of per run
+            for values in columns.values():
+                if len(values) < row_count:
+                    values.extend([None] * (row_count - len(values)))
             
             page_token = runs_page.token
             
@@ -106,11 +139,17 @@ def export_runs_detailed(
         
         print(f"Retrieved all {total_runs} runs from experiment")
         
-        runs_df = pd.DataFrame(detailed_runs_data)
+        metadata = {"parameters": sorted(param_set), "metrics": sorted(metric_set), "tags": sorted(tag_set)}
         
-        csv_path = os.path.join(output_dir, f"{experiment.name}_runs.csv")
-        runs_df.to_csv(csv_path, index=False)
-        print(f"Runs summary saved to {csv_path}")
+        runs_table = pa.table({column_name: pa.array(values) for column_name, values in columns.items()})
+        
+        if output_format == "csv":
+            runs_path = os.path.join(output_dir, f"{experiment.name}_runs.csv")
+            pa_csv.write_csv(runs_table, runs_path)
+        else:
+            runs_path = os.path.join(output_dir, f"{experiment.name}_runs.parquet")
+            pq.write_table(runs_table, runs_path, compression="zstd")
+        print(f"Runs summary saved to {runs_path}")
         
         metadata_path = os.path.join(output_dir, f"{experiment.name}_metadata.json")
         with open(metadata_path, 'w') as f:
@@ -121,29 +160,25 @@ def export_runs_detailed(
             artifacts_dir = os.path.join(output_dir, "artifacts")
             os.makedirs(artifacts_dir, exist_ok=True)
             
-            for i, run in enumerate(detailed_runs_data):
-                run_id = run['run_id']
-                print(f"Downloading artifacts for run {i+1}/{len(detailed_runs_data)}: {run_id}")
-                run_artifacts_dir = os.path.join(artifacts_dir, run_id)
-                os.makedirs(run_artifacts_dir, exist_ok=True)
-                
-                try:
-                    artifacts = client.list_artifacts(run_id)
-                    for artifact in artifacts:
-                        if artifact.is_dir:
-                            client.download_artifacts(run_id, artifact.path, dst_path=run_artifacts_dir)
-                        else:
-                            artifact_path = os.path.dirname(artifact.path) if os.path.dirname(artifact.path) else ""
-                            dst_dir = os.path.join(run_artifacts_dir, artifact_path)
-                            os.makedirs(dst_dir, exist_ok=True)
-                            client.download_artifacts(run_id, artifact.path, dst_path=dst_dir)
-                except Exception as e:
-                    print(f"Error downloading artifacts for run {run_id}: {e}")
+            run_ids = columns.get('run_id', [])
+            if run_ids:
+                with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(run_ids)))) as executor:
+                    futures = {
+                        executor.submit(_download_run_artifacts, client, run_id, artifacts_dir): run_id
+                        for run_id in run_ids
+                    }
+                    for i, future in enumerate(as_completed(futures)):
+                        run_id = futures[future]
+                        try:
+                            future.result()
+                            print(f"Downloaded artifacts for run {i+1}/{len(run_ids)}: {run_id}")
+                        except Exception as e:
+                            print(f"Error downloading artifacts for run {run_id}: {e}")
 
         summary_report = {
             'total_runs': total_runs,
-            'successful_runs': len([r for r in detailed_runs_data if r['status'] == 'FINISHED']),
-            'failed_runs': len([r for r in detailed_runs_data if r['status'] == 'FAILED']),
+            'successful_runs': columns.get('status', []).count('FINISHED'),
+            'failed_runs': columns.get('status', []).count('FAILED'),
             'experiment_name': experiment.name,
             'experiment_id': experiment.experiment_id,
             'tracking_uri': mlflow.get_tracking_uri(),
@@ -172,13 +207,17 @@ def export_runs_detailed(
 @click.option('--output-dir', default=None, help='Directory to export runs')
 @click.option('--tracking-uri', default=None, help='MLflow tracking URI (e.g. sqlite:///mlflow.db, http://localhost:5000)')
 @click.option('--include-artifacts/--no-include-artifacts', default=True, help='Export run artifacts')
-def main(experiment_name, output_dir, tracking_uri, include_artifacts):
+@click.option('--max-workers', default=MAX_DOWNLOAD_WORKERS, show_default=True, help='Number of concurrent artifact downloads')
+@click.option('--output-format', type=click.Choice(['parquet', 'csv']), default='parquet', show_default=True, help='Format of the exported runs file')
+def main(experiment_name, output_dir, tracking_uri, include_artifacts, max_workers, output_format):
     """Export MLflow runs with clear type preservation"""
     export_runs_detailed(
         experiment_name=experiment_name,
         output_dir=output_dir,
         include_artifacts=include_artifacts,
-        tracking_uri=tracking_uri
+        tracking_uri=tracking_uri,
+        max_workers=max_workers,
+        output_format=output_format
     )
 
 if __name__ == "__main__":
@@ -1,10 +1,25 @@
 import os
 import click
 import json
+import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import numpy as np
 import pandas as pd
 import mlflow
+from mlflow.entities import Metric, Param, RunTag
 from mlflow.tracking import MlflowClient
+from mlflow.utils.time import get_current_time_millis
 from typing import Dict, Optional, Tuple
+import _exp_cache
+
+SYSTEM_COLUMNS = [
+    'run_id', 'experiment_id', 'user_id', 'start_time', 
+    'end_time', 'status', 'lifecycle_stage'
+]
+MAX_IMPORT_WORKERS = 16
+# Direct SQL stores take two pooled connections per log_batch, the default pool holds 15
+LOCAL_STORE_IMPORT_WORKERS = 4
+PROGRESS_INTERVAL = 1000
 
 def import_runs(
     csv_path: str,
@@ -13,19 +28,22 @@ def import_runs(
     import_artifacts: bool = True,
     create_experiment: bool = True,
     metadata_path: Optional[str] = None,
-    tracking_uri: Optional[str] = None
+    tracking_uri: Optional[str] = None,
+    max_workers: Optional[int] = None
 ):
     """
-    Import runs from a CSV export with proper parameter and metric handling based on prefixes
+    Import runs from a CSV or Parquet export with proper parameter and metric handling based on prefixes
     
     Args:
-        csv_path (str): Path to the CSV file containing run data
+        csv_path (str): Path to the CSV or Parquet file containing run data
         experiment_name (str): Destination experiment name
         artifacts_dir (str, optional): Directory containing run artifacts
         import_artifacts (bool): Whether to import artifacts
         create_experiment (bool): Whether to create the experiment if it doesn't exist
         metadata_path (str, optional): Path to the metadata JSON file (if available)
         tracking_uri (str, optional): MLflow tracking URI
+        max_workers (int, optional): Number of runs imported concurrently. Defaults to 16 for
+            http(s) tracking servers and 4 otherwise
     """
     if tracking_uri:
         mlflow.set_tracking_uri(tracking_uri)
@@ -36,7 +54,7 @@ def import_runs(
     client = MlflowClient()
 
     try:
-        experiment = client.get_experiment_by_name(experiment_name)
+        experiment = _exp_cache.get_experiment_by_name(experiment_name)
         if not experiment and create_experiment:
             experiment_id = client.create_experiment(experiment_name)
             print(f"Created new experiment: {experiment_name} (ID: {experiment_id})")
@@ -50,10 +68,11 @@ def import_runs(
         return
 
     try:
-        runs_df = pd.read_csv(csv_path)
+        typed = csv_path.endswith('.parquet')
+        runs_df = pd.read_parquet(csv_path) if typed else read_runs_csv(csv_path)
         print(f"Loaded {len(runs_df)} runs from {csv_path}")
     except Exception as e:
-        print(f"Error reading CSV file: {e}")
+        print(f"Error reading runs file: {e}")
         return
 
     metadata = {"parameters": [], "metrics": [], "tags": []}
@@ -66,60 +85,42 @@ def import_runs(
         except Exception as e:
             print(f"Error loading metadata, will rely on column prefixes: {e}")
     
+    plan = build_column_plan(runs_df, metadata, typed=typed)
+    run_blocks = build_run_blocks(runs_df, plan)
     imported_runs = []
     failed_runs = []
 
-    for index, run_data in runs_df.iterrows():
-        try:
-            print(f"Importing run {index+1}/{len(runs_df)}")
-            
-            params, metrics, tags = extract_run_data(run_data, metadata)
-            
-            with mlflow.start_run(experiment_id=experiment_id) as active_run:
-                if params:
-                    mlflow.log_params(params)
-                    print(f"Logged {len(params)} parameters")
-
-                if metrics:
-                    mlflow.log_metrics(metrics)
-                    print(f"Logged {len(metrics)} metrics")
-
-                if tags:
-                    mlflow.set_tags(tags)
-                    print(f"Set {len(tags)} tags")
-
-                if import_artifacts and artifacts_dir:
-                    original_run_id = str(run_data.get('run_id', ''))
-                    if original_run_id:
-                        run_artifacts_path = os.path.join(artifacts_dir, 'artifacts', original_run_id)
-                        
-                        if os.path.exists(run_artifacts_path):
-                            print(f"Importing artifacts from {run_artifacts_path}")
-                            artifact_count = 0
-                            for root, _, files in os.walk(run_artifacts_path):
-                                for file in files:
-                                    full_path = os.path.join(root, file)
-                                    rel_path = os.path.relpath(full_path, run_artifacts_path)
-                                    
-                                    try:
-                                        artifact_path = os.path.dirname(rel_path) if os.path.dirname(rel_path) else None
-                                        mlflow.log_artifact(full_path, artifact_path=artifact_path)
-                                        artifact_count += 1
-                                    except Exception as artifact_error:
-                                        print(f"Error logging artifact {rel_path}: {artifact_error}")
-                            
-                            print(f"Imported {artifact_count} artifacts")
-                        else:
-                            print(f"No artifacts directory found at {run_artifacts_path}")
-
-                imported_runs.append(active_run.info.run_id)
-                print(f"Successfully imported run to {active_run.info.run_id}")
+    run_ids = runs_df['run_id'].to_numpy() if 'run_id' in runs_df.columns else None
+    
+    if max_workers is None:
+        resolved_uri = mlflow.get_tracking_uri()
+        max_workers = MAX_IMPORT_WORKERS if resolved_uri.startswith(("http://", "https://")) else LOCAL_STORE_IMPORT_WORKERS
+    
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = {}
+        for index in range(len(runs_df)):
+            original_run_id = str(run_ids[index]) if run_ids is not None else ''
+            run_artifacts_path = None
+            if import_artifacts and artifacts_dir and original_run_id:
+                run_artifacts_path = os.path.join(artifacts_dir, 'artifacts', original_run_id)
+            future = executor.submit(_import_single_run, client, experiment_id, run_blocks, index, run_artifacts_path)
+            futures[future] = index
 
-        except Exception as e:
-            print(f"Failed to import run {index}: {e}")
-            import traceback
-            traceback.print_exc()
-            failed_runs.append(index)
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                run_id = future.result()
+                imported_runs.append(run_id)
+            except Exception as e:
+                print(f"Failed to import run {index}: {e}")
+                traceback.print_exception(e)
+                failed_runs.append(index)
+
+            completed = len(imported_runs) + len(failed_runs)
+            if completed % PROGRESS_INTERVAL == 0:
+                print(f"Processed {completed}/{len(runs_df)} runs")
+
+    failed_runs.sort()
 
     summary = {
         'total_runs_attempted': len(runs_df),
@@ -145,79 +146,230 @@ def import_runs(
 
     return summary
 
-def extract_run_data(run_data: pd.Series, metadata: Dict) -> Tuple[Dict, Dict, Dict]:
+def read_runs_csv(csv_path: str) -> pd.DataFrame:
     """
-    Extract parameters, metrics, and tags from a run data series based on prefixes
+    Read a runs CSV, using the column prefixes to set dtypes instead of inferring them
     
     Args:
-        run_data (pd.Series): Series containing run data
-        metadata (Dict): Dictionary with parameter, metric, and tag lists
+        csv_path (str): Path to the CSV file containing run data
     
     Returns:
-        Tuple[Dict, Dict, Dict]: Tuple of parameters, metrics, and tags dictionaries
+        pd.DataFrame: DataFrame containing run data
+    """
+    header = pd.read_csv(csv_path, nrows=0).columns
+    dtype_map = {}
+    for col in header:
+        if col.startswith('metric:'):
+            dtype_map[col] = 'float64'
+        elif col.startswith('param:') or col.startswith('tag:'):
+            dtype_map[col] = 'string'
+    
+    try:
+        return pd.read_csv(csv_path, dtype=dtype_map, engine='c')
+    except ValueError as e:
+        # Non-numeric metric values, e.g. in an edited CSV, are coerced later on
+        print(f"Warning: Could not read CSV with prefix dtypes, falling back to inference: {e}")
+        return pd.read_csv(csv_path)
+
+def _import_single_run(
+    client: MlflowClient,
+    experiment_id: str,
+    run_blocks: Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]],
+    position: int,
+    run_artifacts_path: Optional[str] = None
+) -> str:
+    """
+    Create a run and log the parameters, metrics, tags and artifacts of a single exported run
+    
+    Uses the client API instead of mlflow.start_run so concurrent imports do not share the
+    fluent API active run state.
+    
+    Args:
+        client (MlflowClient): MLflow client to log with
+        experiment_id (str): Destination experiment ID
+        run_blocks (Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]]): Column blocks returned by build_run_blocks
+        position (int): Position of the run within the blocks
+        run_artifacts_path (str, optional): Directory with the exported artifacts of the run
+    
+    Returns:
+        str: ID of the created run
+    """
+    params, metrics, tags = extract_run_data(run_blocks, position)
+    
+    run = client.create_run(experiment_id)
+    run_id = run.info.run_id
+    try:
+        if params or metrics or tags:
+            timestamp = get_current_time_millis()
+            client.log_batch(
+                run_id=run_id,
+                metrics=[Metric(k, v, timestamp, 0) for k, v in metrics.items()],
+                params=[Param(k, str(v)) for k, v in params.items()],
+                tags=[RunTag(k, str(v)) for k, v in tags.items()]
+            )
+
+        if run_artifacts_path:
+            if os.path.exists(run_artifacts_path):
+                # log_artifacts uploads the whole tree and keeps the relative subdirectories
+                try:
+                    client.log_artifacts(run_id, run_artifacts_path)
+                except Exception as artifact_error:
+                    print(f"Error logging artifacts from {run_artifacts_path}: {artifact_error}")
+            else:
+                print(f"No artifacts directory found at {run_artifacts_path}")
+    except Exception:
+        client.set_terminated(run_id, status="FAILED")
+        raise
+
+    client.set_terminated(run_id)
+    return run_id
+
+def _to_row_arrays(block: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Convert a column block into arrays that can be indexed by row position without building a Series
+    
+    Args:
+        block (pd.DataFrame): Column block to convert
+    
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: Column names, values and not-null mask
+    """
+    return block.columns.to_numpy(), block.to_numpy(), block.notna().to_numpy(dtype=bool)
+
+def build_column_plan(runs_df: pd.DataFrame, metadata: Dict, typed: bool = False) -> Dict[str, Tuple[str, str]]:
     """
-    params = {}
-    metrics = {}
-    tags = {}
+    Classify every run column once by prefix, metadata or dtype
     
-    system_columns = [
-        'run_id', 'experiment_id', 'user_id', 'start_time', 
-        'end_time', 'status', 'lifecycle_stage'
-    ]
+    Args:
+        runs_df (pd.DataFrame): DataFrame containing run data
+        metadata (Dict): Dictionary with parameter, metric, and tag lists
+        typed (bool): Whether the column dtypes were stored with the data (Parquet), unclassified
+            columns are then classified by dtype instead of by value
     
-    for col in run_data.index:
-        if pd.isna(run_data[col]) or col in system_columns:
+    Returns:
+        Dict[str, Tuple[str, str]]: Column names mapped to their kind ('param', 'metric', 'tag' or 'infer')
+            and the name to log them with
+    """
+    plan = {}
+    for col in runs_df.columns:
+        if col in SYSTEM_COLUMNS:
             continue
             
         if col.startswith('param:'):
-            param_name = col[6:]  
-            params[param_name] = str(run_data[col])
+            plan[col] = ('param', col[6:])
         elif col.startswith('metric:'):
-            metric_name = col[7:] 
-            try:
-                metrics[metric_name] = float(run_data[col])
-            except (ValueError, TypeError):
-                print(f"Warning: Could not convert metric '{metric_name}' to float. Value: {run_data[col]}")
+            plan[col] = ('metric', col[7:])
         elif col.startswith('tag:'):
-            tag_name = col[4:]  
-            tags[tag_name] = str(run_data[col])
+            plan[col] = ('tag', col[4:])
         elif col in metadata['parameters']:
-            param_name = col
-            params[param_name] = str(run_data[col])
+            plan[col] = ('param', col)
         elif col in metadata['metrics']:
-            metric_name = col
-            try:
-                metrics[metric_name] = float(run_data[col])
-            except (ValueError, TypeError):
-                print(f"Warning: Could not convert metric '{metric_name}' to float. Value: {run_data[col]}")
+            plan[col] = ('metric', col)
         elif col in metadata['tags']:
-            tag_name = col
-            tags[tag_name] = str(run_data[col])
+            plan[col] = ('tag', col)
+        elif typed:
+            plan[col] = ('metric', col) if pd.api.types.is_float_dtype(runs_df[col]) else ('param', col)
         else:
-            try:
-                float_val = float(run_data[col])
-                # If it's an integer-like float, it's likely a parameter, only used when no metadata specified.
-                if float_val.is_integer() and abs(float_val) < 1000:
-                    params[col] = str(run_data[col])
-                else:
-                    metrics[col] = float_val
-                    print(f"Warning: Inferring '{col}' as metric based on value type.")
-            except (ValueError, TypeError):
-                params[col] = str(run_data[col])
-                print(f"Warning: Inferring '{col}' as parameter based on value type.")
+            plan[col] = ('infer', col)
+    return plan
+
+def build_run_blocks(
+    runs_df: pd.DataFrame,
+    plan: Dict[str, Tuple[str, str]]
+) -> Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Coerce the run columns of each kind in the plan column-wise
+    
+    Args:
+        runs_df (pd.DataFrame): DataFrame containing run data
+        plan (Dict[str, Tuple[str, str]]): Column plan returned by build_column_plan
+    
+    Returns:
+        Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]]: Parameter, metric and tag blocks named as they are logged
+    """
+    names = {kind: {} for kind in ('param', 'metric', 'tag', 'infer')}
+    for col, (kind, name) in plan.items():
+        names[kind][col] = name
+    
+    metric_source = runs_df[list(names['metric'])]
+    metric_block = metric_source.apply(pd.to_numeric, errors='coerce')
+    unconverted = (metric_source.notna() & metric_block.isna()).sum()
+    for col, count in unconverted[unconverted > 0].items():
+        print(f"Warning: Could not convert {count} values of metric '{names['metric'][col]}' to float.")
+    
+    param_source = runs_df[list(names['param'])]
+    tag_source = runs_df[list(names['tag'])]
+    
+    # Unclassified columns, only present when no metadata is specified, are split per value:
+    # integer-like numbers and non-numeric values are likely parameters, other numbers metrics
+    infer_source = runs_df[list(names['infer'])]
+    infer_numeric = infer_source.apply(pd.to_numeric, errors='coerce')
+    inferred_metric = infer_numeric.notna() & ~((infer_numeric % 1 == 0) & (infer_numeric.abs() < 1000))
+    inferred_param = infer_source.notna() & ~inferred_metric
+    for col in infer_source.columns:
+        if inferred_metric[col].any():
+            print(f"Warning: Inferring '{col}' as metric based on value type.")
+        if (inferred_param[col] & infer_numeric[col].isna()).any():
+            print(f"Warning: Inferring '{col}' as parameter based on value type.")
+    
+    param_block = pd.concat([
+        param_source.astype(str).where(param_source.notna()).rename(columns=names['param']),
+        infer_source.astype(str).where(inferred_param),
+    ], axis=1)
+    metric_block = pd.concat([
+        metric_block.rename(columns=names['metric']),
+        infer_numeric.where(inferred_metric),
+    ], axis=1)
+    
+    return {
+        'params': _to_row_arrays(param_block),
+        'metrics': _to_row_arrays(metric_block),
+        'tags': _to_row_arrays(tag_source.astype(str).where(tag_source.notna()).rename(columns=names['tag'])),
+    }
+
+def _row_to_dict(block: Tuple[np.ndarray, np.ndarray, np.ndarray], position: int) -> Dict:
+    """
+    Build a dictionary with the non-null values of a single row of a column block
+    
+    Args:
+        block (Tuple[np.ndarray, np.ndarray, np.ndarray]): Column names, values and not-null mask
+        position (int): Position of the row within the block
+    
+    Returns:
+        Dict: Column names mapped to the row values
+    """
+    names, values, mask = block
+    row_mask = mask[position]
+    return dict(zip(names[row_mask].tolist(), values[position][row_mask].tolist()))
+
+def extract_run_data(run_blocks: Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]], position: int) -> Tuple[Dict, Dict, Dict]:
+    """
+    Extract parameters, metrics, and tags of a single run from the prepared column blocks
+    
+    Args:
+        run_blocks (Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]]): Column blocks returned by build_run_blocks
+        position (int): Position of the run within the blocks
+    
+    Returns:
+        Tuple[Dict, Dict, Dict]: Tuple of parameters, metrics, and tags dictionaries
+    """
+    params = _row_to_dict(run_blocks['params'], position)
+    metrics = _row_to_dict(run_blocks['metrics'], position)
+    tags = _row_to_dict(run_blocks['tags'], position)
     
     return params, metrics, tags
 
 @click.command()
-@click.option('--csv-path', required=True, help='Path to the runs CSV file')
+@click.option('--csv-path', required=True, help='Path to the runs CSV or Parquet file')
 @click.option('--experiment-name', required=True, help='Destination experiment name')
 @click.option('--artifacts-dir', default=None, help='Directory containing run artifacts')
 @click.option('--metadata-path', default=None, help='Path to metadata JSON file')
 @click.option('--tracking-uri', default=None, help='MLflow tracking URI (e.g. sqlite:///mlflow.db, http://localhost:5000)')
 @click.option('--import-artifacts/--no-import-artifacts', default=True, help='Import run artifacts')
 @click.option('--create-experiment/--no-create-experiment', default=True, help='Create experiment if it does not exist')
-def main(csv_path, experiment_name, artifacts_dir, metadata_path, tracking_uri, import_artifacts, create_experiment):
-    """Import MLflow runs from a CSV export with proper type handling"""
+@click.option('--max-workers', type=int, default=None, help='Number of runs imported concurrently (default: 16 for http(s) tracking URIs, 4 otherwise)')
+def main(csv_path, experiment_name, artifacts_dir, metadata_path, tracking_uri, import_artifacts, create_experiment, max_workers):
+    """Import MLflow runs from a CSV or Parquet export with proper type handling"""
     import_runs(
         csv_path=csv_path, 
         experiment_name=experiment_name,
@@ -225,7 +377,8 @@ def main(csv_path, experiment_name, artifacts_dir, metadata_path, tracking_uri,
         import_artifacts=import_artifacts,
         create_experiment=create_experiment,
         metadata_path=metadata_path,
-        tracking_uri=tracking_uri
+        tracking_uri=tracking_uri,
+        max_workers=max_workers
     )
 
 if __name__ == "__main__":
@@ -1,5 +1,6 @@
 import mlflow, click
 from mlflow.tracking import MlflowClient
+import _exp_cache
 
 def restore_experiments(experiment_names, tracking_uri):
     """
@@ -18,18 +19,15 @@ def restore_experiments(experiment_names, tracking_uri):
     client = MlflowClient()
 
     try:
-        # List all experiments, including deleted ones
-        all_experiments = client.search_experiments(view_type=mlflow.entities.ViewType.ALL)
-
         for experiment_name in experiment_names:
-            # Find the deleted experiment by name
-            deleted_experiment = next(
-                (exp for exp in all_experiments if exp.name == experiment_name and exp.lifecycle_stage == "deleted"),
-                None,
-            )
+            # Deleted experiments are returned too, the lifecycle stage is checked on the fresh result
+            experiment = client.get_experiment_by_name(experiment_name)
+
+            deleted_experiment = experiment if experiment and experiment.lifecycle_stage == "deleted" else None
 
             if deleted_experiment:
                 client.restore_experiment(deleted_experiment.experiment_id)
+                _exp_cache.invalidate(experiment_name)
                 print(f"Experiment '{experiment_name}' restored successfully.")
             else:
                 print(f"Deleted experiment '{experiment_name}' not found.")